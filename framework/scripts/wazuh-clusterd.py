@@ -9,7 +9,7 @@ import argparse
 import os
 import sys
 import time
-from wazuh.cluster import cluster, __version__, __author__, __ossec_name__, __licence__, master, local_server, worker
+from wazuh.cluster import cluster, __version__, __author__, __ossec_name__, __licence__
 from wazuh import common, configuration, pyDaemonModule, Wazuh
 
 
@@ -67,6 +67,8 @@ def print_version():
 # Master main
 #
 async def master_main(args, cluster_config, cluster_items, logger):
+    # node modules (and uvloop, DAPI...) are only imported once the cluster is going to run
+    from wazuh.cluster import master, local_server
     cluster.context_tag.set('Master')
     cluster.context_subtag.set("Main")
     my_server = master.Master(performance_test=args.performance_test, concurrency_test=args.concurrency_test,
@@ -83,6 +85,7 @@ async def master_main(args, cluster_config, cluster_items, logger):
 # Worker main
 #
 async def worker_main(args, cluster_config, cluster_items, logger):
+    from wazuh.cluster import worker, local_server
     cluster.context_tag.set('Worker')
     cluster.context_subtag.set("Main")
     while True:
@@ -145,9 +148,12 @@ if __name__ == '__main__':
         debug_mode = 0
 
     # set correct permissions on cluster.log file
-    if os.path.exists('{0}/logs/cluster.log'.format(common.ossec_path)):
-        os.chown('{0}/logs/cluster.log'.format(common.ossec_path), common.ossec_uid(), common.ossec_gid())
-        os.chmod('{0}/logs/cluster.log'.format(common.ossec_path), 0o660)
+    cluster_log = os.path.join(common.ossec_path, 'logs', 'cluster.log')
+    try:
+        os.chown(cluster_log, common.ossec_uid(), common.ossec_gid())
+        os.chmod(cluster_log, 0o660)
+    except FileNotFoundError:
+        pass
 
     main_logger = set_logging(debug_mode)
 
@@ -15,7 +15,8 @@ from time import time
 from os import path, listdir, stat, chmod, chown, remove, unlink
 from subprocess import check_output
 from shutil import rmtree, copyfileobj
-from operator import eq, setitem, add
+from stat import S_ISDIR
+from operator import eq
 import json
 import logging
 import logging.handlers
@@ -26,7 +27,6 @@ from calendar import month_abbr
 from random import random
 import glob
 import gzip
-from functools import reduce
 import zipfile
 from contextvars import ContextVar
 
@@ -70,8 +70,9 @@ def get_cluster_items():
     try:
         with open('{0}/framework/wazuh/cluster/cluster.json'.format(common.ossec_path)) as f:
             cluster_items = json.load(f)
-        list(map(lambda x: setitem(x, 'permissions', int(x['permissions'], base=0)),
-                 filter(lambda x: 'permissions' in x, cluster_items['files'].values())))
+        for file_items in cluster_items['files'].values():
+            if type(file_items) is dict and 'permissions' in file_items:
+                file_items['permissions'] = int(file_items['permissions'], base=0)
         return cluster_items
     except Exception as e:
         raise WazuhException(3005, str(e))
@@ -137,16 +138,20 @@ def walk_dir(dirname, recursive, files, excluded_files, excluded_extensions, get
     except OSError as e:
         raise WazuhException(3015, str(e))
 
+    excluded_extensions = tuple(excluded_extensions)
     for entry in entries:
-        if entry in excluded_files or reduce(add, map(lambda x: entry[-(len(x)):] == x, excluded_extensions)):
+        if entry in excluded_files or entry.endswith(excluded_extensions):
             continue
 
         try:
             full_path = path.join(dirname, entry)
+            absolute_path = common.ossec_path + full_path
             if entry in files or files == ["all"]:
-
-                if not path.isdir(common.ossec_path + full_path):
-                    file_mod_time = datetime.utcfromtimestamp(stat(common.ossec_path + full_path).st_mtime)
+                # a single stat call gives both the file type and its modification time
+                entry_stat = stat(absolute_path)
+                is_dir = S_ISDIR(entry_stat.st_mode)
+                if not is_dir:
+                    file_mod_time = datetime.utcfromtimestamp(entry_stat.st_mtime)
 
                     if whoami == 'worker' and file_mod_time < (datetime.utcnow() - timedelta(minutes=30)):
                         continue
@@ -160,11 +165,13 @@ def walk_dir(dirname, recursive, files, excluded_files, excluded_extensions, get
                         entry_metadata['merged'] = False
 
                     if get_md5:
-                        entry_metadata['md5'] = md5(common.ossec_path + full_path)
+                        entry_metadata['md5'] = md5(absolute_path)
 
                     walk_files[full_path] = entry_metadata
+            else:
+                is_dir = recursive and path.isdir(absolute_path)
 
-            if recursive and path.isdir(common.ossec_path + full_path):
+            if recursive and is_dir:
                 walk_files.update(walk_dir(full_path, recursive, files, excluded_files, excluded_extensions,
                                            get_cluster_item_key, get_md5, whoami))
 
@@ -174,9 +181,10 @@ def walk_dir(dirname, recursive, files, excluded_files, excluded_extensions, get
     return walk_files
 
 
-def get_files_status(node_type, node_name, get_md5=True):
+def get_files_status(node_type, node_name, get_md5=True, cluster_items=None):
 
-    cluster_items = get_cluster_items()
+    if cluster_items is None:
+        cluster_items = get_cluster_items()
 
     final_items = {}
     for file_path, item in cluster_items['files'].items():
@@ -242,7 +250,7 @@ async def decompress_files(zip_path, ko_files_name="cluster_control.json"):
     return ko_files, zip_dir
 
 
-def compare_files(good_files, check_files, node_name):
+def compare_files(good_files, check_files, node_name, cluster_items=None):
     def split_on_condition(seq, condition):
         """
         Splits a sequence into two generators based on a conditon
@@ -253,20 +261,22 @@ def compare_files(good_files, check_files, node_name):
         l1, l2 = itertools.tee((condition(item), item) for item in seq)
         return (i for p, i in l1 if p), (i for p, i in l2 if not p)
 
-    cluster_items = get_cluster_items()['files']
+    if cluster_items is None:
+        cluster_items = get_cluster_items()
+    files_items = cluster_items['files']
 
     # missing files will be the ones that are present in good files but not in the check files
     missing_files = {key: good_files[key] for key in good_files.keys() - check_files.keys()}
 
     # extra files are the ones present in check files but not in good files and aren't extra valid
     extra_valid, extra = split_on_condition(check_files.keys() - good_files.keys(),
-                                            lambda x: cluster_items[check_files[x]['cluster_item_key']]['extra_valid'])
+                                            lambda x: files_items[check_files[x]['cluster_item_key']]['extra_valid'])
     extra_files = {key: check_files[key] for key in extra}
     extra_valid_files = {key: check_files[key] for key in extra_valid}
     # shared files are the ones present in both sets.
     all_shared = [x for x in check_files.keys() & good_files.keys() if check_files[x]['md5'] != good_files[x]['md5']]
     shared_e_v, shared = split_on_condition(all_shared,
-                                            lambda x: cluster_items[check_files[x]['cluster_item_key']]['extra_valid'])
+                                            lambda x: files_items[check_files[x]['cluster_item_key']]['extra_valid'])
     shared_e_v = list(shared_e_v)
     if shared_e_v:
         # merge all shared extra valid files into a single one.
@@ -465,7 +465,8 @@ class MasterHandler(server.AbstractServerHandler, c_common.WazuhCommon):
         logger.info("Analyzing worker integrity: Received {} files to check.".format(len(files_checksums)))
 
         # classify files in shared, missing, extra and extra valid.
-        worker_files_ko, counts = cluster.compare_files(self.server.integrity_control, files_checksums, self.name)
+        worker_files_ko, counts = cluster.compare_files(self.server.integrity_control, files_checksums, self.name,
+                                                        cluster_items=self.cluster_items)
 
         # health check
         self.sync_integrity_status['total_files'] = counts
@@ -721,7 +722,8 @@ class Master(server.AbstractServer):
         while True:
             file_integrity_logger.debug("Calculating")
             try:
-                self.integrity_control = cluster.get_files_status('master', self.configuration['node_name'])
+                self.integrity_control = cluster.get_files_status('master', self.configuration['node_name'],
+                                                                  cluster_items=self.cluster_items)
             except Exception as e:
                 file_integrity_logger.error("Error calculating file integrity: {}".format(e))
             file_integrity_logger.debug("Calculated.")
@@ -103,6 +103,78 @@ def test_checking_configuration(read_config):
             cluster.check_cluster_config(configuration)
 
 
+@pytest.mark.parametrize('run_files, running', [
+    (['wazuh-clusterd-0234.pid', 'ossec-analysisd-0235.pid'], 'yes'),
+    (['ossec-analysisd-0235.pid'], 'no')
+])
+def test_get_cluster_status(run_files, running):
+    """
+    Checks the cluster status only depends on the wazuh-clusterd daemon
+    """
+    with patch('wazuh.cluster.utils.read_cluster_config', return_value={'disabled': False}), \
+            patch('wazuh.cluster.utils.listdir', return_value=run_files), \
+            patch('wazuh.cluster.utils.exists', return_value=True) as exists_mock:
+        assert cluster.get_cluster_status() == {'enabled': 'yes', 'running': running}
+        if running == 'yes':
+            exists_mock.assert_called_once_with('/proc/0234')
+        else:
+            exists_mock.assert_not_called()
+
+
+test_cluster_items = {
+    'files': {
+        '/etc/shared/': {'permissions': 0o660, 'source': 'master', 'files': ['merged.mg'], 'recursive': True,
+                         'restart': False, 'remove_subdirs_if_empty': True, 'extra_valid': False,
+                         'description': 'shared configuration files'},
+        'excluded_files': ['ar.conf', 'ossec.conf'],
+        'excluded_extensions': ['~', '.tmp', '.lock', '.swp']
+    },
+    'sync_options': {'get_agentinfo_newer_than': 1800}
+}
+
+
+@pytest.mark.parametrize('cluster_items', [
+    test_cluster_items,
+    None
+])
+def test_get_files_status(cluster_items):
+    """
+    Checks cluster.json is only read when the cluster items aren't given
+    """
+    shared_file = {'/etc/shared/default/merged.mg': {'mod_time': '2019-01-01 00:00:00', 'merged': False, 'md5': '1',
+                                                     'cluster_item_key': '/etc/shared/'}}
+    with patch('wazuh.cluster.cluster.get_cluster_items', return_value=test_cluster_items) as items_mock, \
+            patch('wazuh.cluster.cluster.walk_dir', return_value=shared_file) as walk_dir_mock:
+        assert cluster.get_files_status('master', 'node01', cluster_items=cluster_items) == shared_file
+        walk_dir_mock.assert_called_once_with('/etc/shared/', True, ['merged.mg'], ['ar.conf', 'ossec.conf'],
+                                              ['~', '.tmp', '.lock', '.swp'], '/etc/shared/', True, 'master')
+        assert items_mock.call_count == (1 if cluster_items is None else 0)
+
+
+@pytest.mark.parametrize('cluster_items', [
+    test_cluster_items,
+    None
+])
+def test_compare_files(cluster_items):
+    """
+    Checks files are classified without reading cluster.json when the cluster items are given
+    """
+    good_files = {'/etc/shared/a/merged.mg': {'md5': '1', 'cluster_item_key': '/etc/shared/'},
+                  '/etc/shared/b/merged.mg': {'md5': '2', 'cluster_item_key': '/etc/shared/'},
+                  '/etc/shared/c/merged.mg': {'md5': '3', 'cluster_item_key': '/etc/shared/'}}
+    check_files = {'/etc/shared/a/merged.mg': {'md5': '1', 'cluster_item_key': '/etc/shared/'},
+                   '/etc/shared/b/merged.mg': {'md5': '0', 'cluster_item_key': '/etc/shared/'},
+                   '/etc/shared/d/merged.mg': {'md5': '4', 'cluster_item_key': '/etc/shared/'}}
+    with patch('wazuh.cluster.cluster.get_cluster_items', return_value=test_cluster_items) as items_mock:
+        files, count = cluster.compare_files(good_files, check_files, 'worker1', cluster_items=cluster_items)
+        assert items_mock.call_count == (1 if cluster_items is None else 0)
+
+    assert count == {'missing': 1, 'extra': 1, 'extra_valid': 0, 'shared': 1}
+    assert list(files['missing']) == ['/etc/shared/c/merged.mg']
+    assert list(files['extra']) == ['/etc/shared/d/merged.mg']
+    assert list(files['shared']) == ['/etc/shared/b/merged.mg']
+
+
 agent_info = b"""Linux |agent1 |3.10.0-862.el7.x86_64 |#1 SMP Fri Apr 20 16:44:24 UTC 2018 |x86_64 [CentOS Linux|centos: 7 (Core)] - Wazuh v3.7.2 / d10d46b48c280384e8773a5fa24ecacb
 5b458d5fa953a391de1130a2625f3df2 merged.mg
 
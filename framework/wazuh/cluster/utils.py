@@ -2,12 +2,14 @@
 # Created by Wazuh, Inc. <info@wazuh.com>.
 # This program is a free software; you can redistribute it and/or modify it under the terms of GPLv2
 
+import copy
 import fcntl
+import fnmatch
 import logging
 import re
 import socket
 import typing
-from glob import glob
+from os import listdir
 from os.path import join, exists
 
 import wazuh.common as common
@@ -17,6 +19,18 @@ from wazuh.exception import WazuhException
 
 logger = logging.getLogger('wazuh')
 execq_lockfile = join(common.ossec_path, "var/run/.api_execq_lock")
+_re_pidfile = re.compile(r'.+\-(\d+)\.pid$')
+cluster_default_configuration = {
+    'disabled': False,
+    'node_type': 'master',
+    'name': 'wazuh',
+    'node_name': 'node01',
+    'key': '',
+    'port': 1516,
+    'bind_addr': '0.0.0.0',
+    'nodes': ['NODE_IP'],
+    'hidden': 'no'
+}
 
 
 def read_cluster_config(config_file=common.ossec_conf) -> typing.Dict:
@@ -25,33 +39,23 @@ def read_cluster_config(config_file=common.ossec_conf) -> typing.Dict:
 
     :return: Dictionary with cluster configuration.
     """
-    cluster_default_configuration = {
-        'disabled': False,
-        'node_type': 'master',
-        'name': 'wazuh',
-        'node_name': 'node01',
-        'key': '',
-        'port': 1516,
-        'bind_addr': '0.0.0.0',
-        'nodes': ['NODE_IP'],
-        'hidden': 'no'
-    }
-
     try:
         config_cluster = get_ossec_conf(section='cluster', conf_file=config_file)
     except WazuhException as e:
         if e.code == 1106:
             # if no cluster configuration is present in ossec.conf, return default configuration but disabling it.
-            cluster_default_configuration['disabled'] = True
-            return cluster_default_configuration
+            config_cluster = {name: copy.copy(value) for name, value in cluster_default_configuration.items()}
+            config_cluster['disabled'] = True
+            return config_cluster
         else:
             raise WazuhException(3006, e.message)
     except Exception as e:
         raise WazuhException(3006, str(e))
 
     # if any value is missing from user's cluster configuration, add the default one:
-    for value_name in set(cluster_default_configuration.keys()) - set(config_cluster.keys()):
-        config_cluster[value_name] = cluster_default_configuration[value_name]
+    for value_name, default_value in cluster_default_configuration.items():
+        if value_name not in config_cluster:
+            config_cluster[value_name] = copy.copy(default_value)
 
     if isinstance(config_cluster['port'], str) and not config_cluster['port'].isdigit():
         raise WazuhException(3004, "Cluster port must be an integer.")
@@ -88,28 +92,36 @@ def read_cluster_config(config_file=common.ossec_conf) -> typing.Dict:
     return config_cluster
 
 
-def get_manager_status() -> typing.Dict:
+def get_manager_status(processes=None) -> typing.Dict:
     """
     Returns the Manager processes that are running.
 
+    :param processes: List of daemons to check. All manager daemons are checked by default.
     :return: Dictionary (keys: status, daemon).
     """
+    if processes is None:
+        processes = ['ossec-agentlessd', 'ossec-analysisd', 'ossec-authd', 'ossec-csyslogd', 'ossec-dbd',
+                     'ossec-monitord', 'ossec-execd', 'ossec-integratord', 'ossec-logcollector', 'ossec-maild',
+                     'ossec-remoted', 'ossec-reportd', 'ossec-syscheckd', 'wazuh-clusterd', 'wazuh-modulesd',
+                     'wazuh-db']
+
+    data, run_dir = {}, join(common.ossec_path, 'var/run')
+    # list the run directory once instead of checking several paths for every process
+    try:
+        run_files = set(listdir(run_dir))
+    except OSError:
+        run_files = set()
 
-    processes = ['ossec-agentlessd', 'ossec-analysisd', 'ossec-authd', 'ossec-csyslogd', 'ossec-dbd', 'ossec-monitord',
-                 'ossec-execd', 'ossec-integratord', 'ossec-logcollector', 'ossec-maild', 'ossec-remoted',
-                 'ossec-reportd', 'ossec-syscheckd', 'wazuh-clusterd', 'wazuh-modulesd', 'wazuh-db']
-
-    data, pidfile_regex, run_dir = {}, re.compile(r'.+\-(\d+)\.pid$'), join(common.ossec_path, 'var/run')
     for process in processes:
-        pidfile = glob(join(run_dir, f"{process}-*.pid"))
-        if exists(join(run_dir, f'{process}.failed')):
+        pidfile = fnmatch.filter(run_files, f"{process}-*.pid")
+        if f'{process}.failed' in run_files:
             data[process] = 'failed'
-        elif exists(join(run_dir, f'.restart')):
+        elif '.restart' in run_files:
             data[process] = 'restarting'
-        elif exists(join(run_dir, f'{process}.start')):
+        elif f'{process}.start' in run_files:
             data[process] = 'starting'
         elif pidfile:
-            process_pid = pidfile_regex.match(pidfile[0]).group(1)
+            process_pid = _re_pidfile.match(pidfile[0]).group(1)
             # if a pidfile exists but the process is not running, it means the process crashed and
             # wasn't able to remove its own pidfile.
             data[process] = 'running' if exists(join('/proc', process_pid)) else 'failed'
@@ -125,8 +137,9 @@ def get_cluster_status() -> typing.Dict:
 
     :return: Dictionary with cluster status
     """
+    clusterd_status = get_manager_status(processes=['wazuh-clusterd'])['wazuh-clusterd']
     return {"enabled": "no" if read_cluster_config()['disabled'] else "yes",
-            "running": "yes" if get_manager_status()['wazuh-clusterd'] == 'running' else "no"}
+            "running": "yes" if clusterd_status == 'running' else "no"}
 
 
 def manager_restart():
@@ -199,8 +199,8 @@ class WorkerHandler(client.AbstractClient, c_common.WazuhCommon):
             try:
                 if self.connected:
                     before = time.time()
-                    await SyncWorker(cmd=b'sync_i_w_m', files_to_sync={}, checksums=cluster.get_files_status('master',
-                                                                                                             self.name),
+                    checksums = cluster.get_files_status('master', self.name, cluster_items=self.cluster_items)
+                    await SyncWorker(cmd=b'sync_i_w_m', files_to_sync={}, checksums=checksums,
                                      logger=integrity_logger, worker=self).sync()
                     after = time.time()
                     integrity_logger.debug("Time synchronizing integrity: {} s".format(after - before))
@@ -222,7 +222,8 @@ class WorkerHandler(client.AbstractClient, c_common.WazuhCommon):
                 if self.connected:
                     before = time.time()
                     agent_info_logger.info("Starting to send agent status files")
-                    worker_files = cluster.get_files_status('worker', self.name, get_md5=False)
+                    worker_files = cluster.get_files_status('worker', self.name, get_md5=False,
+                                                            cluster_items=self.cluster_items)
                     await SyncWorker(cmd=b'sync_a_w_m', files_to_sync=worker_files, checksums=worker_files,
                                      logger=agent_info_logger, worker=self).sync()
                     after = time.time()
@@ -3,10 +3,11 @@
 # Copyright (C) 2015-2020, Wazuh Inc.
 # Created by Wazuh, Inc. <info@wazuh.com>.
 # This program is free software; you can redistribute it and/or modify it under the terms of GPLv2
+import copy
 import json
 import random
 import time
-from os import remove, path as os_path
+from os import remove, stat, path as os_path
 import re
 from xml.dom.minidom import parseString
 from wazuh.exception import WazuhException
@@ -440,6 +441,39 @@ def _ar_conf2json(file_path):
     return data
 
 
+# Parsed ossec.conf files: {path: ((st_ino, st_mtime_ns, st_size), configuration)}
+_ossec_conf_cache = {}
+
+
+def _read_ossec_conf(conf_file):
+    """
+    Returns ossec.conf parsed to JSON. The result is reused while the file is not modified.
+
+    :param conf_file: Path of the configuration file to read.
+    :return: ossec.conf as dictionary. It must not be modified.
+    """
+    try:
+        conf_stat = stat(conf_file)
+        cache_key = (conf_stat.st_ino, conf_stat.st_mtime_ns, conf_stat.st_size)
+    except OSError:
+        _ossec_conf_cache.pop(conf_file, None)
+        cache_key = None
+
+    cached_key, cached_data = _ossec_conf_cache.get(conf_file, (None, None))
+    if cache_key is not None and cache_key == cached_key:
+        return cached_data
+
+    # Read XML
+    xml_data = load_wazuh_xml(conf_file)
+
+    # Parse XML to JSON
+    data = _ossecconf2json(xml_data)
+    if cache_key is not None:
+        _ossec_conf_cache[conf_file] = (cache_key, data)
+
+    return data
+
+
 # Main functions
 def get_ossec_conf(section=None, field=None, conf_file=common.ossec_conf):
     """
@@ -451,11 +485,7 @@ def get_ossec_conf(section=None, field=None, conf_file=common.ossec_conf):
     :return: ossec.conf (manager) as dictionary.
     """
     try:
-        # Read XML
-        xml_data = load_wazuh_xml(conf_file)
-
-        # Parse XML to JSON
-        data = _ossecconf2json(xml_data)
+        data = _read_ossec_conf(conf_file)
     except Exception as e:
         raise WazuhException(1101, str(e))
 
@@ -474,7 +504,8 @@ def get_ossec_conf(section=None, field=None, conf_file=common.ossec_conf):
         except:
             raise WazuhException(1103)
 
-    return data
+    # callers are free to modify the returned configuration, so the cached one is never handed out
+    return copy.deepcopy(data)
 
 
 def get_agent_conf(group_id=None, offset=0, limit=common.database_limit, filename='agent.conf', return_format=None):
@@ -30,6 +30,7 @@ from wazuh.exception import WazuhException
 from wazuh.utils import previous_month, cut_array, sort_array, search_array, tail, load_wazuh_xml, safe_move
 
 _re_logtest = re.compile(r"^.*(?:ERROR: |CRITICAL: )(?:\[.*\] )?(.*)$")
+_re_ossec_log_fields = re.compile(r"^(\d\d\d\d/\d\d/\d\d\s\d\d:\d\d:\d\d)\s(\S+)(?:\[.*)?:\s(DEBUG|INFO|CRITICAL|ERROR|WARNING):(.*)$")
 execq_lockfile = join(common.ossec_path, "var", "run", ".api_execq_lock")
 
 
@@ -52,9 +53,7 @@ def replace_in_comments(original_content, to_be_replaced, replacement):
 
 
 def __get_ossec_log_fields(log):
-    regex_category = re.compile(r"^(\d\d\d\d/\d\d/\d\d\s\d\d:\d\d:\d\d)\s(\S+)(?:\[.*)?:\s(DEBUG|INFO|CRITICAL|ERROR|WARNING):(.*)$")
-
-    match = re.search(regex_category, log)
+    match = _re_ossec_log_fields.search(log)
 
     if match:
         date = match.group(1)
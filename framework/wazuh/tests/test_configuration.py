@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# Copyright (C) 2015-2020, Wazuh Inc.
+# Created by Wazuh, Inc. <info@wazuh.com>.
+# This program is a free software; you can redistribute it and/or modify it under the terms of GPLv2
+
+import os
+import pytest
+from unittest.mock import patch
+
+with patch('wazuh.common.ossec_uid'):
+    with patch('wazuh.common.ossec_gid'):
+        from wazuh import configuration
+        from wazuh.exception import WazuhException
+        from wazuh.utils import load_wazuh_xml
+
+test_ossec_conf = """<ossec_config>
+  <global>
+    <jsonout_output>yes</jsonout_output>
+    <white_list>127.0.0.1</white_list>
+    <white_list>^localhost.localdomain$</white_list>
+  </global>
+</ossec_config>
+"""
+
+
+@pytest.fixture
+def ossec_conf(tmpdir):
+    """
+    Writes a test ossec.conf and empties the parsed configuration cache
+    """
+    conf_file = tmpdir.join('ossec.conf')
+    conf_file.write(test_ossec_conf)
+    configuration._ossec_conf_cache.clear()
+    yield str(conf_file)
+    configuration._ossec_conf_cache.clear()
+
+
+def keep_mtime(conf_file, new_content):
+    """
+    Rewrites conf_file in place keeping its modification time
+    """
+    mtime_ns = os.stat(conf_file).st_mtime_ns
+    with open(conf_file, 'w') as f:
+        f.write(new_content)
+    os.utime(conf_file, ns=(mtime_ns, mtime_ns))
+
+
+def test_get_ossec_conf_cached(ossec_conf):
+    """
+    Checks ossec.conf is not parsed again while it doesn't change
+    """
+    with patch('wazuh.configuration.load_wazuh_xml', wraps=load_wazuh_xml) as load_mock:
+        first = configuration.get_ossec_conf(section='global', conf_file=ossec_conf)
+        second = configuration.get_ossec_conf(section='global', conf_file=ossec_conf)
+
+    assert load_mock.call_count == 1
+    assert first == second == {'jsonout_output': 'yes', 'white_list': ['127.0.0.1', '^localhost.localdomain$']}
+
+
+def test_get_ossec_conf_mtime_changed(ossec_conf):
+    """
+    Checks ossec.conf is parsed again when only its modification time changes
+    """
+    with patch('wazuh.configuration.load_wazuh_xml', wraps=load_wazuh_xml) as load_mock:
+        configuration.get_ossec_conf(conf_file=ossec_conf)
+        mtime_ns = os.stat(ossec_conf).st_mtime_ns + 10**9
+        os.utime(ossec_conf, ns=(mtime_ns, mtime_ns))
+        configuration.get_ossec_conf(conf_file=ossec_conf)
+
+    assert load_mock.call_count == 2
+
+
+def test_get_ossec_conf_size_changed(ossec_conf):
+    """
+    Checks ossec.conf is parsed again when its size changes, even if the modification time is kept
+    """
+    with patch('wazuh.configuration.load_wazuh_xml', wraps=load_wazuh_xml) as load_mock:
+        configuration.get_ossec_conf(conf_file=ossec_conf)
+        keep_mtime(ossec_conf, test_ossec_conf.replace('yes', 'no'))
+        result = configuration.get_ossec_conf(section='global', field='jsonout_output', conf_file=ossec_conf)
+
+    assert load_mock.call_count == 2
+    assert result == 'no'
+
+
+def test_get_ossec_conf_inode_changed(ossec_conf):
+    """
+    Checks ossec.conf is parsed again when it is replaced by another file (i.e. safe_move) with same size and mtime
+    """
+    new_conf = ossec_conf + '.new'
+    with open(new_conf, 'w') as f:
+        f.write(test_ossec_conf.replace('127.0.0.1', '127.0.0.2'))
+    old_stat = os.stat(ossec_conf)
+    os.utime(new_conf, ns=(old_stat.st_mtime_ns, old_stat.st_mtime_ns))
+
+    with patch('wazuh.configuration.load_wazuh_xml', wraps=load_wazuh_xml) as load_mock:
+        configuration.get_ossec_conf(conf_file=ossec_conf)
+        os.replace(new_conf, ossec_conf)
+        new_stat = os.stat(ossec_conf)
+        assert (new_stat.st_mtime_ns, new_stat.st_size) == (old_stat.st_mtime_ns, old_stat.st_size)
+        assert new_stat.st_ino != old_stat.st_ino
+        result = configuration.get_ossec_conf(section='global', field='white_list', conf_file=ossec_conf)
+
+    assert load_mock.call_count == 2
+    assert result == ['127.0.0.2', '^localhost.localdomain$']
+
+
+def test_get_ossec_conf_stat_error(ossec_conf):
+    """
+    Checks the cached configuration is dropped when ossec.conf can't be stat'ed
+    """
+    configuration.get_ossec_conf(conf_file=ossec_conf)
+    assert ossec_conf in configuration._ossec_conf_cache
+
+    os.remove(ossec_conf)
+    with pytest.raises(WazuhException, match=r'.* 1101 .*'):
+        configuration.get_ossec_conf(conf_file=ossec_conf)
+    assert ossec_conf not in configuration._ossec_conf_cache
+
+
+def test_get_ossec_conf_returns_copy(ossec_conf):
+    """
+    Checks modifying the returned configuration doesn't change the cached one
+    """
+    global_conf = configuration.get_ossec_conf(section='global', conf_file=ossec_conf)
+    global_conf['white_list'].append('10.0.0.1')
+    global_conf['jsonout_output'] = 'no'
+
+    full_conf = configuration.get_ossec_conf(conf_file=ossec_conf)
+    full_conf['global']['white_list'].clear()
+
+    assert configuration.get_ossec_conf(section='global', conf_file=ossec_conf) == \
+        {'jsonout_output': 'yes', 'white_list': ['127.0.0.1', '^localhost.localdomain$']}
@@ -53,30 +53,31 @@ def test_manager():
     'starting'
 ])
 @patch('wazuh.cluster.utils.exists')
-@patch('wazuh.cluster.utils.glob')
-def test_status(manager_glob, manager_exists, test_manager, process_status):
+@patch('wazuh.cluster.utils.listdir')
+def test_status(manager_listdir, manager_exists, test_manager, process_status):
     """
     Tests manager.status() function in two cases:
         * PID files are created and processed are running,
         * No process is running and therefore no PID files have been created
-    :param manager_glob: mock of glob.glob function
+    :param manager_listdir: mock of os.listdir function
     :param manager_exists: mock of os.path.exists function
     :param test_manager: pytest fixture
     :param process_status: status to test (valid values: running/stopped/failed/restarting).
     :return:
     """
-    def mock_glob(path_to_check):
-        return [path_to_check.replace('*', '0234')] if process_status == 'running' else []
-
-    def mock_exists(path_to_check):
-        if path_to_check == '/proc/0234':
-            return process_status == 'running'
-        else:
-            return path_to_check.endswith(f'.{process_status.replace("ing","").replace("re", "")}') or \
-                   path_to_check.endswith(f'.{process_status.replace("ing","")}')
-
-    manager_glob.side_effect = mock_glob
-    manager_exists.side_effect = mock_exists
+    # get the daemon names from an empty run directory so the test doesn't depend on the list of daemons
+    manager_listdir.return_value = []
+    processes = list(status())
+    run_files = {
+        'running': [f'{process}-0234.pid' for process in processes],
+        'stopped': [],
+        'failed': [f'{process}.failed' for process in processes],
+        'restarting': ['.restart'],
+        'starting': [f'{process}.start' for process in processes]
+    }
+
+    manager_listdir.return_value = run_files[process_status]
+    manager_exists.side_effect = lambda path_to_check: path_to_check == '/proc/0234'
     manager_status = status()
     assert isinstance(manager_status, dict)
     assert all(process_status == x for x in manager_status.values())
@@ -84,6 +85,21 @@ def test_status(manager_glob, manager_exists, test_manager, process_status):
         manager_exists.assert_any_call("/proc/0234")
 
 
+@pytest.mark.parametrize('listdir_exception', [
+    FileNotFoundError,
+    PermissionError,
+    NotADirectoryError
+])
+@patch('wazuh.cluster.utils.listdir')
+def test_status_unreadable_run_dir(manager_listdir, listdir_exception):
+    """
+    Tests manager.status() reports every daemon as stopped when the run directory can't be listed
+    """
+    manager_listdir.side_effect = listdir_exception
+    manager_status = status()
+    assert manager_status and all(x == 'stopped' for x in manager_status.values())
+
+
 @pytest.mark.parametrize('input_file, output_file, content_type', [
     ('input_rules_file', 'output_rules_file', 'application/xml'),
     ('input_decoders_file', 'output_decoders_file', 'application/xml'),
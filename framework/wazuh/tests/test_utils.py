@@ -268,6 +268,25 @@ def test_tail():
     assert len(result) == 20
 
 
+@pytest.mark.parametrize('content, n', [
+    # 'é' is two bytes long and is split between the last 8 KiB block and the previous one
+    ('first line\n' + 'a' * 100 + 'é' + 'b' * 8190 + '\n', 1),
+    ('first line\n' + 'a' * 100 + 'é' + 'b' * 8190 + '\n', 2),
+    # lines longer than the block size, with and without a trailing new line
+    ('\n'.join(str(i) * 20000 for i in range(5)) + '\n', 2),
+    ('\n'.join(str(i) * 20000 for i in range(5)), 2),
+    ('\n'.join(str(i) * 20000 for i in range(5)) + '\n', 10),
+    # no lines requested
+    ('first line\nsecond line\nthird line\n', 0)
+])
+def test_tail_block_boundaries(tmpdir, content, n):
+    """Test tail function returns complete lines when they are split between blocks."""
+    log_file = tmpdir.join('test.log')
+    log_file.write_binary(content.encode())
+
+    assert tail(str(log_file), n) == (content.splitlines()[-n:] if n > 0 else [])
+
+
 @patch('wazuh.utils.chmod')
 def test_chmod_r(mock_chmod):
     """Tests chmod_r function."""
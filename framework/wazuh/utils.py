@@ -288,30 +288,27 @@ def tail(filename, n=20):
     :param n: number of lines.
     :return: Array of last lines.
     """
+    if n <= 0:
+        return []
+
     with open(filename, 'rb') as f:
         total_lines_wanted = n
 
-        BLOCK_SIZE = 1024
+        BLOCK_SIZE = 8192
         f.seek(0, 2)
         block_end_byte = f.tell()
         lines_to_go = total_lines_wanted
-        block_number = -1
-        blocks = []  # blocks of size BLOCK_SIZE, in reverse order starting from the end of the file
-        while lines_to_go > 0 and block_end_byte > 0:
-            if (block_end_byte - BLOCK_SIZE > 0):
-                # read the last block we haven't yet read
-                f.seek(block_number * BLOCK_SIZE, 2)
-                blocks.append(f.read(BLOCK_SIZE).decode('utf-8', errors='replace'))
-            else:
-                # file too small, start from beginning
-                f.seek(0, 0)
-                # only read what was not read
-                blocks.append(f.read(block_end_byte).decode('utf-8', errors='replace'))
-            lines_found = blocks[-1].count('\n')
-            lines_to_go -= lines_found
-            block_end_byte -= BLOCK_SIZE
-            block_number -= 1
-        all_read_text = ''.join(reversed(blocks))
+        blocks = []  # blocks of up to BLOCK_SIZE bytes, in reverse order starting from the end of the file
+        # one more newline than lines wanted is needed to be sure the first returned line is complete
+        while lines_to_go >= 0 and block_end_byte > 0:
+            # read the last block we haven't yet read (or what is left of the file if it is smaller)
+            block_start_byte = max(block_end_byte - BLOCK_SIZE, 0)
+            f.seek(block_start_byte, 0)
+            blocks.append(f.read(block_end_byte - block_start_byte))
+            lines_to_go -= blocks[-1].count(b'\n')
+            block_end_byte = block_start_byte
+        # decode once so multi-byte characters split between blocks are kept
+        all_read_text = b''.join(reversed(blocks)).decode('utf-8', errors='replace')
 
     return all_read_text.splitlines()[-total_lines_wanted:]
 
@@ -533,45 +530,48 @@ def plain_dict_to_nested_dict(data, nested=None, non_nested=None, force_fields=[
     return nested_dict
 
 
+# load_wazuh_xml patterns, compiled once at import time
+_xml_custom_entities = {
+    'backslash': '\\'
+}
+_xml_default_entities = ['amp', 'lt', 'gt', 'apos', 'quot']
+_re_xml_comment = re.compile(r"(<!--(.*?)-->)", flags=re.MULTILINE | re.DOTALL)
+_re_xml_custom_entities = [(re.compile(re.escape(replacement)), f'&{character};')
+                           for character, replacement in _xml_custom_entities.items()]
+_re_xml_lt = re.compile(r"<(?!/?\w+.+>|!--)")
+_re_xml_escaped_lt = re.compile(r'\\<')
+_re_xml_escaped_gt = re.compile(r'\\>')
+_re_xml_amp = re.compile(f"&(?!({'|'.join(_xml_default_entities + list(_xml_custom_entities))});)")
+_xml_entities = '<!DOCTYPE xmlfile [\n' + \
+                '\n'.join([f'<!ENTITY {name} "{value}">' for name, value in _xml_custom_entities.items()]) + \
+                '\n]>\n'
+
+
 def load_wazuh_xml(xml_path):
     with open(xml_path) as f:
         data = f.read()
 
     # -- characters are not allowed in XML comments
-    xml_comment = re.compile(r"(<!--(.*?)-->)", flags=re.MULTILINE | re.DOTALL)
-    for comment in xml_comment.finditer(data):
-        good_comment = comment.group(2).replace('--', '..')
-        data = data.replace(comment.group(2), good_comment)
+    data = _re_xml_comment.sub(lambda comment: '<!--' + comment.group(2).replace('--', '..') + '-->', data)
 
     # < characters should be scaped as &lt; unless < is starting a <tag> or a comment
 
-    custom_entities = {
-        'backslash': '\\'
-    }
-
     # replace every custom entity
-    for character, replacement in custom_entities.items():
-        data = re.sub(replacement.replace('\\', '\\\\'), f'&{character};', data)
+    for regex, entity in _re_xml_custom_entities:
+        data = regex.sub(entity, data)
 
-    data = re.sub(r"<(?!/?\w+.+>|!--)", "&lt;", data)
+    data = _re_xml_lt.sub("&lt;", data)
 
     # replace \< by &lt;
-    data = re.sub(r'\\<', '&lt;', data)
+    data = _re_xml_escaped_lt.sub('&lt;', data)
 
     # replace \> by &gt;
-    data = re.sub(r'\\>', '&gt;', data)
-
-    # default entities
-    default_entities = ['amp', 'lt', 'gt', 'apos', 'quot']
+    data = _re_xml_escaped_gt.sub('&gt;', data)
 
     # & characters should be scaped if they don't represent an &entity;
-    data = re.sub(f"&(?!({'|'.join(default_entities + list(custom_entities))});)", "&amp;", data)
-
-    entities = '<!DOCTYPE xmlfile [\n' + \
-               '\n'.join([f'<!ENTITY {name} "{value}">' for name, value in custom_entities.items()]) +\
-               '\n]>\n'
+    data = _re_xml_amp.sub("&amp;", data)
 
-    return fromstring(entities + '<root_tag>' + data + '</root_tag>')
+    return fromstring(_xml_entities + '<root_tag>' + data + '</root_tag>')
 
 
 class WazuhVersion: